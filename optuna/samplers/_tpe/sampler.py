@@ -27,6 +27,7 @@ from optuna.search_space import IntersectionSearchSpace
 from optuna.search_space.group_decomposed import _GroupDecomposedSearchSpace
 from optuna.search_space.group_decomposed import _SearchSpaceGroup
 from optuna.study._multi_objective import _fast_non_domination_rank
+from optuna.study._multi_objective import _trials_to_loss_array
 from optuna.study._study_direction import StudyDirection
 from optuna.trial import FrozenTrial
 from optuna.trial import TrialState
@@ -655,8 +656,7 @@ def _split_complete_trials_multi_objective(
         # The type of trials must be `list`, but not `Sequence`.
         return [], list(trials)
 
-    lvals = np.array([trial.values for trial in trials])
-    lvals *= np.array([-1.0 if d == StudyDirection.MAXIMIZE else 1.0 for d in study.directions])
+    lvals = _trials_to_loss_array(trials, study.directions)
 
     # Solving HSSP for variables number of times is a waste of time.
     nondomination_ranks = _fast_non_domination_rank(lvals, n_below=n_below)
@@ -5,12 +5,11 @@ from collections.abc import Callable
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from optuna.samplers.nsgaii._constraints_evaluation import _evaluate_penalty
 from optuna.samplers.nsgaii._constraints_evaluation import _validate_constraints
 from optuna.study import StudyDirection
 from optuna.study._multi_objective import _fast_non_domination_rank
+from optuna.study._multi_objective import _trials_to_loss_array
 from optuna.trial import FrozenTrial
 
 
@@ -123,10 +122,7 @@ def _rank_population(
     if len(population) == 0:
         return []
 
-    objective_values = np.array([trial.values for trial in population], dtype=np.float64)
-    objective_values *= np.array(
-        [-1.0 if d == StudyDirection.MAXIMIZE else 1.0 for d in directions]
-    )
+    objective_values = _trials_to_loss_array(population, directions)
     penalty = _evaluate_penalty(population) if is_constrained else None
 
     domination_ranks = _fast_non_domination_rank(objective_values, penalty=penalty)
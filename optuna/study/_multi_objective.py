@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+import functools
 
 import numpy as np
 
@@ -23,16 +24,34 @@ def _get_pareto_front_trials_by_trials(
     if len(trials) == 0:
         return []
 
-    if any(len(t.values) != len(directions) for t in trials):
+    loss_values = _trials_to_loss_array(trials, directions)
+    on_front = _is_pareto_front(loss_values, assume_unique_lexsorted=False)
+    return [trials[i] for i in np.flatnonzero(on_front)]
+
+
+def _trials_to_loss_array(
+    trials: Sequence[FrozenTrial], directions: Sequence[StudyDirection]
+) -> np.ndarray:
+    # NOTE: The values are flipped in bulk so that every objective is to be minimized, which
+    # avoids calling `_normalize_value` for each value.
+    loss_values = _stack_values(trials, len(directions))
+    loss_values *= _direction_signs(directions)
+    return loss_values
+
+
+def _stack_values(trials: Sequence[FrozenTrial], n_objectives: int) -> np.ndarray:
+    # NOTE: np.fromiter writes the values into a buffer of the known size directly, which is
+    # quicker than np.asarray on a list of lists. As it does not see the boundaries of the trials,
+    # the number of the values is checked beforehand so that the rows are not misaligned.
+    if any(len(t.values) != n_objectives for t in trials):
         raise ValueError(
             "The number of the values and the number of the objectives must be identical."
         )
 
-    loss_values = np.asarray(
-        [[_normalize_value(v, d) for v, d in zip(t.values, directions)] for t in trials]
+    values = np.fromiter(
+        (v for t in trials for v in t.values), dtype=np.float64, count=len(trials) * n_objectives
     )
-    on_front = _is_pareto_front(loss_values, assume_unique_lexsorted=False)
-    return [t for t, is_pareto in zip(trials, on_front) if is_pareto]
+    return values.reshape(len(trials), n_objectives)
 
 
 def _get_pareto_front_trials(
@@ -100,18 +119,20 @@ def _fast_non_domination_rank(
     is_infeasible = np.logical_and(~is_penalty_nan, penalty > 0)
 
     # First, we calculate the domination rank for feasible trials.
-    ranks[is_feasible] = _calculate_nondomination_rank(loss_values[is_feasible], n_below=n_below)
-    n_below -= np.count_nonzero(is_feasible)
+    feasible_ranks = _calculate_nondomination_rank(loss_values[is_feasible], n_below=n_below)
+    ranks[is_feasible] = feasible_ranks
+    n_below -= feasible_ranks.size
 
     # Second, we calculate the domination rank for infeasible trials.
-    top_rank_infeasible = np.max(ranks[is_feasible], initial=-1) + 1
-    ranks[is_infeasible] = top_rank_infeasible + _calculate_nondomination_rank(
+    top_rank_infeasible = np.max(feasible_ranks, initial=-1) + 1
+    infeasible_ranks = _calculate_nondomination_rank(
         penalty[is_infeasible][:, np.newaxis], n_below=n_below
     )
-    n_below -= np.count_nonzero(is_infeasible)
+    ranks[is_infeasible] = top_rank_infeasible + infeasible_ranks
+    n_below -= infeasible_ranks.size
 
     # Third, we calculate the domination rank for trials with no penalty information.
-    top_rank_penalty_nan = np.max(ranks[~is_penalty_nan], initial=-1) + 1
+    top_rank_penalty_nan = top_rank_infeasible + np.max(infeasible_ranks, initial=-1) + 1
     ranks[is_penalty_nan] = top_rank_penalty_nan + _calculate_nondomination_rank(
         loss_values[is_penalty_nan], n_below=n_below
     )
@@ -119,14 +140,62 @@ def _fast_non_domination_rank(
     return ranks
 
 
+_N_TRIALS_FOR_SINGLE_PIVOT = 64
+
+
 def _is_pareto_front_nd(unique_lexsorted_loss_values: np.ndarray) -> np.ndarray:
     # NOTE(nabenabe0928): I tried the Kung's algorithm below, but it was not really quick.
     # https://github.com/optuna/optuna/pull/5302#issuecomment-1988665532
     # As unique_lexsorted_loss_values[:, 0] is sorted, we do not need it to judge dominance.
+    # NOTE: loss_values is a view and the remaining rows are tracked by nondominated_indices,
+    # so that no copy of the whole array is made.
     loss_values = unique_lexsorted_loss_values[:, 1:]
-    n_trials = loss_values.shape[0]
+    (n_trials, n_objectives) = loss_values.shape
+    # NOTE: Pivots are processed in blocks so that each row of loss_values is compared with
+    # several pivots per pass instead of being streamed through memory once per pivot. This pays
+    # off only for a large front, so the block grows only while all the pivots are on the front
+    # and they dominate few of the remaining trials.
+    max_block_size = max(1, 4096 // (n_objectives * 8))
+    block_size = 1
     on_front = np.zeros(n_trials, dtype=bool)
     nondominated_indices = np.arange(n_trials)
+    while len(nondominated_indices) > _N_TRIALS_FOR_SINGLE_PIVOT:
+        n_remaining = len(nondominated_indices)
+        if block_size == 1:
+            # NOTE: trials[j] cannot dominate trials[i] for i < j because of lexsort.
+            # Therefore, nondominated_indices[0] is always non-dominated.
+            top_index = nondominated_indices[0]
+            on_front[top_index] = True
+            nondominated_indices = nondominated_indices[1:]
+            is_nondominated = np.any(
+                loss_values[nondominated_indices] < loss_values[top_index], axis=1
+            )
+            nondominated_indices = nondominated_indices[is_nondominated]
+            n_pivots = 1
+            are_pivots_on_front = True
+        else:
+            pivot_indices = nondominated_indices[:block_size]
+            pivots = loss_values[pivot_indices]
+            # NOTE: Likewise, pivots[k] is non-dominated unless any of pivots[:k] dominates it.
+            # is_dominated[i, k] judges `not np.any(loss_values[i] < pivots[k])`.
+            is_dominated_in_block = ~np.any(pivots[:, np.newaxis] < pivots, axis=-1)
+            is_pivot_on_front = ~np.tril(is_dominated_in_block, k=-1).any(axis=1)
+            on_front[pivot_indices[is_pivot_on_front]] = True
+            nondominated_indices = nondominated_indices[len(pivot_indices) :]
+            is_dominated = ~np.any(loss_values[nondominated_indices, np.newaxis] < pivots, axis=-1)
+            nondominated_indices = nondominated_indices[~is_dominated.any(axis=1)]
+            n_pivots = len(pivot_indices)
+            are_pivots_on_front = bool(is_pivot_on_front.all())
+        n_dominated = n_remaining - n_pivots - len(nondominated_indices)
+        if are_pivots_on_front and n_dominated <= n_pivots:
+            block_size = min(2 * block_size, max_block_size)
+        else:
+            block_size = max(1, block_size // 2)
+
+    # NOTE: The block bookkeeping above does not pay off for a few trials, e.g., the many small
+    # inputs from the WFG algorithm, so the remaining trials are filtered one pivot at a time.
+    if len(nondominated_indices) < n_trials:
+        loss_values = loss_values[nondominated_indices]
     while len(loss_values):
         # The following judges `np.any(loss_values[i] < loss_values[0])` for each `i`.
         nondominated_and_not_top = np.any(loss_values < loss_values[0], axis=1)
@@ -141,9 +210,11 @@ def _is_pareto_front_nd(unique_lexsorted_loss_values: np.ndarray) -> np.ndarray:
 
 def _is_pareto_front_2d(unique_lexsorted_loss_values: np.ndarray) -> np.ndarray:
     n_trials = unique_lexsorted_loss_values.shape[0]
-    cummin_value1 = np.minimum.accumulate(unique_lexsorted_loss_values[:, 1])
-    on_front = np.ones(n_trials, dtype=bool)
-    on_front[1:] = cummin_value1[1:] < cummin_value1[:-1]  # True if cummin value1 is new minimum.
+    values1 = unique_lexsorted_loss_values[:, 1]
+    on_front = np.empty(n_trials, dtype=bool)
+    on_front[:1] = True
+    # True if value1 is strictly smaller than all the preceding value1, i.e., a new minimum.
+    np.less(values1[1:], np.minimum.accumulate(values1[:-1]), out=on_front[1:])
     return on_front
 
 
@@ -167,12 +238,29 @@ def _is_pareto_front(loss_values: np.ndarray, assume_unique_lexsorted: bool) ->
     if assume_unique_lexsorted:
         return _is_pareto_front_for_unique_sorted(loss_values)
 
-    unique_lexsorted_loss_values, order_inv = np.unique(loss_values, axis=0, return_inverse=True)
+    unique_lexsorted_loss_values, order_inv = _unique_lexsorted(loss_values)
     on_front = _is_pareto_front_for_unique_sorted(unique_lexsorted_loss_values)
-    # NOTE(nabenabe): We can remove `.reshape(-1)` if ``numpy==2.0.0`` is not used.
-    # https://github.com/numpy/numpy/issues/26738
-    # TODO: Remove `.reshape(-1)` once `numpy==2.0.0` is obsolete.
-    return on_front[order_inv.reshape(-1)]
+    return on_front[order_inv]
+
+
+def _unique_lexsorted(loss_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # NOTE: This is equivalent to `np.unique(loss_values, axis=0, return_inverse=True)`, but
+    # it avoids the structured-dtype copy that `np.unique` makes to sort the rows.
+    # np.lexsort uses the last key as the primary key, so the columns are reversed.
+    order = np.lexsort(loss_values.T[::-1])
+    sorted_loss_values = loss_values[order]
+    is_new = np.empty(len(loss_values), dtype=bool)
+    is_new[:1] = True
+    np.any(sorted_loss_values[1:] != sorted_loss_values[:-1], axis=1, out=is_new[1:])
+    order_inv = np.empty(len(loss_values), dtype=int)
+    order_inv[order] = np.cumsum(is_new) - 1
+    return sorted_loss_values[is_new], order_inv
+
+
+_MAX_N_TRIALS_FOR_DOMINANCE_DEGREE_SORT = 500
+# NOTE: The dominance matrix of bool and its temporary take 2 * n_unique**2 bytes, i.e., 32 MB
+# for 4000 trials.
+_MAX_N_TRIALS_FOR_DOMINANCE_MATRIX = 4000
 
 
 def _calculate_nondomination_rank(
@@ -183,15 +271,34 @@ def _calculate_nondomination_rank(
 
     (n_trials, n_objectives) = loss_values.shape
     if n_objectives == 1:
-        _, ranks = np.unique(loss_values[:, 0], return_inverse=True)
+        # The inverse map into the sorted unique values is exactly the rank.
+        _, ranks = _unique_lexsorted(loss_values)
         return ranks
 
     # It ensures that trials[j] will not dominate trials[i] for i < j.
-    # np.unique does lexsort.
-    unique_lexsorted_loss_values, order_inv = np.unique(loss_values, return_inverse=True, axis=0)
+    unique_lexsorted_loss_values, order_inv = _unique_lexsorted(loss_values)
     n_unique = unique_lexsorted_loss_values.shape[0]
     # Clip n_below.
-    n_below = min(n_below or len(unique_lexsorted_loss_values), len(unique_lexsorted_loss_values))
+    n_below = min(n_below or n_unique, n_unique)
+    if n_objectives >= 3 and n_unique <= _MAX_N_TRIALS_FOR_DOMINANCE_DEGREE_SORT:
+        # NOTE: The quadratic cost of the dominance matrix pays off only for small n_unique.
+        # For two objectives, each peel below is linear, so it is always quicker.
+        return _dominance_degree_sort(unique_lexsorted_loss_values, n_below)[order_inv]
+    if (
+        3 <= n_objectives < 6
+        and n_below == n_unique
+        and n_unique <= _MAX_N_TRIALS_FOR_DOMINANCE_MATRIX
+    ):
+        # NOTE: The peels below stop early for a small n_below, e.g., by TPESampler, but the
+        # dominance matrix is quicker when all the ranks are required, e.g., by NSGAIISampler.
+        return _dominance_degree_sort(unique_lexsorted_loss_values, n_below)[order_inv]
+    if n_objectives >= 6 and n_below == n_unique:
+        # NOTE: Each peel below compares all the remaining trials, and it was faster to
+        # compare each trial only once by the Best Order Sort for many objectives. However,
+        # it cannot stop early, so the peels below are quicker when only the top n_below
+        # trials are required, e.g., by TPESampler.
+        return _best_order_sort(unique_lexsorted_loss_values)[order_inv]
+
     ranks = np.zeros(n_unique, dtype=int)
     rank = 0
     indices = np.arange(n_unique)
@@ -204,10 +311,99 @@ def _calculate_nondomination_rank(
         rank += 1
 
     ranks[indices] = rank  # Rank worse than the top n_below is defined as the worst rank.
-    # NOTE(nabenabe): We can remove `.reshape(-1)` if ``numpy==2.0.0`` is not used.
-    # https://github.com/numpy/numpy/issues/26738
-    # TODO: Remove `.reshape(-1)` once `numpy==2.0.0` is obsolete.
-    return ranks[order_inv.reshape(-1)]
+    return ranks[order_inv]
+
+
+def _dominance_degree_sort(unique_lexsorted_loss_values: np.ndarray, n_below: int) -> np.ndarray:
+    # NOTE: This is based on the dominance degree approach (DDA-NS) by Zhou et al. (2017).
+    # https://doi.org/10.1109/TEVC.2016.2600642
+    # The dominance degree of (i, j) is the number of objectives where trials[i] is not worse
+    # than trials[j], and trials[i] dominates trials[j] if it equals n_objectives. The degree is
+    # accumulated as a logical AND here because only the comparison with n_objectives matters.
+    n_trials = unique_lexsorted_loss_values.shape[0]
+    dominates = np.ones((n_trials, n_trials), dtype=bool)
+    for values in unique_lexsorted_loss_values.T:
+        dominates &= values[:, np.newaxis] <= values
+    # As the rows are unique, no trial dominates itself.
+    np.fill_diagonal(dominates, False)
+    if n_trials <= 64:
+        return _bitset_non_dominated_sort(dominates, n_below)
+
+    # NOTE: As in the fast non-dominated sort of NSGA-II, the number of dominators is counted
+    # once, and the Pareto solutions are removed by decrementing the counts of the trials they
+    # dominate. Each peel then takes O(front size * n_trials) instead of copying the matrix.
+    n_dominators = np.count_nonzero(dominates, axis=0)
+    is_remaining = np.ones(n_trials, dtype=bool)
+    ranks = np.empty(n_trials, dtype=int)
+    rank = 0
+    n_ranked = 0
+    while n_ranked < n_below:
+        front_indices = np.flatnonzero(is_remaining & (n_dominators == 0))
+        ranks[front_indices] = rank
+        # Remove the recent Pareto solutions.
+        is_remaining[front_indices] = False
+        n_dominators -= np.count_nonzero(dominates[front_indices], axis=0)
+        n_ranked += front_indices.size
+        rank += 1
+
+    ranks[is_remaining] = rank  # Rank worse than the top n_below is defined as the worst rank.
+    return ranks
+
+
+def _bitset_non_dominated_sort(dominates: np.ndarray, n_below: int) -> np.ndarray:
+    # NOTE: For at most 64 trials, the dominators of each trial and the remaining trials are
+    # packed into 64-bit words, so that each peel takes O(n_trials) word operations instead of
+    # O(n_trials^2) boolean operations on the dominance matrix.
+    n_trials = dominates.shape[0]
+    dominator_bits = _pack_bits(dominates.T)
+    remaining_bits = _pack_bits(np.ones(n_trials, dtype=bool))
+    is_remaining = np.ones(n_trials, dtype=bool)
+    ranks = np.empty(n_trials, dtype=int)
+    rank = 0
+    while n_trials - np.count_nonzero(is_remaining) < n_below:
+        on_front = is_remaining & (dominator_bits & remaining_bits == 0)
+        ranks[on_front] = rank
+        # Remove the recent Pareto solutions.
+        is_remaining &= ~on_front
+        remaining_bits &= ~_pack_bits(on_front)
+        rank += 1
+
+    ranks[is_remaining] = rank  # Rank worse than the top n_below is defined as the worst rank.
+    return ranks
+
+
+def _pack_bits(flags: np.ndarray) -> np.ndarray:
+    # Pack the last axis of at most 64 flags into np.uint64 with the i-th flag at the i-th bit.
+    packed = np.zeros(flags.shape[:-1] + (8,), dtype=np.uint8)
+    packed[..., : (flags.shape[-1] + 7) // 8] = np.packbits(flags, axis=-1, bitorder="little")
+    return packed.view(np.uint64)[..., 0]
+
+
+def _best_order_sort(unique_lexsorted_loss_values: np.ndarray) -> np.ndarray:
+    # NOTE: This is a vectorized variant of the Best Order Sort by Roy et al. (2016).
+    # https://doi.org/10.1145/2908961.2931684
+    # Each trial is ranked when it first appears in the sorted order of any objective, and
+    # compared only with the trials preceding it in that order. All the dominators of a trial
+    # precede it in every objective, so its rank is one plus the worst rank of them.
+    (n_trials, n_objectives) = unique_lexsorted_loss_values.shape
+    # The stable sort breaks ties by the lexicographic order, where dominators come first.
+    sorted_indices = np.argsort(unique_lexsorted_loss_values, axis=0, kind="stable")
+    positions = np.empty_like(sorted_indices)
+    positions[sorted_indices, np.arange(n_objectives)] = np.arange(n_trials)[:, np.newaxis]
+    first_objectives = np.argmin(positions, axis=1)
+    first_positions = positions[np.arange(n_trials), first_objectives]
+    sorted_loss_values = [
+        unique_lexsorted_loss_values[sorted_indices[:, m]] for m in range(n_objectives)
+    ]
+    ranks = np.empty(n_trials, dtype=int)
+    for i in np.argsort(first_positions, kind="stable"):
+        m, pos = first_objectives[i], first_positions[i]
+        loss_values = unique_lexsorted_loss_values[i]
+        # As the rows are unique, weak dominance by the preceding trials implies dominance.
+        is_dominator = np.all(sorted_loss_values[m][:pos] <= loss_values, axis=1)
+        ranks[i] = np.max(ranks[sorted_indices[:pos, m][is_dominator]], initial=-1) + 1
+
+    return ranks
 
 
 def _dominates(
@@ -242,6 +438,19 @@ def _dominates(
     return all(v0 <= v1 for v0, v1 in zip(normalized_values0, normalized_values1))
 
 
+def _direction_signs(directions: Sequence[StudyDirection]) -> np.ndarray:
+    # Multiplying values by the signs makes every objective to be minimized.
+    return _direction_signs_for_tuple(tuple(directions))
+
+
+@functools.lru_cache(maxsize=128)
+def _direction_signs_for_tuple(directions: tuple[StudyDirection, ...]) -> np.ndarray:
+    signs = np.where([d == StudyDirection.MAXIMIZE for d in directions], -1.0, 1.0)
+    # NOTE: The cached array is shared by all the callers, so it must not be modified.
+    signs.flags.writeable = False
+    return signs
+
+
 def _normalize_value(value: float | None, direction: StudyDirection) -> float:
     if value is None:
         return float("inf")
@@ -165,7 +165,7 @@ class Study:
         # trials. Note that the behavior is undefined when constrained optimization without the
         # violation value in the best-valued trial.
         constraints = best_trial.system_attrs.get(_CONSTRAINTS_KEY)
-        if constraints is not None and any([x > 0.0 for x in constraints]):
+        if constraints is not None and any(x > 0.0 for x in constraints):
             complete_trials = self.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
             feasible_trials = _get_feasible_trials(complete_trials)
             if len(feasible_trials) == 0:
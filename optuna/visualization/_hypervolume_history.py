@@ -10,9 +10,8 @@ from optuna._hypervolume import compute_hypervolume
 from optuna.logging import get_logger
 from optuna.samplers._base import _CONSTRAINTS_KEY
 from optuna.study import Study
-from optuna.study._multi_objective import _dominates
-from optuna.study._study_direction import StudyDirection
-from optuna.trial import FrozenTrial
+from optuna.study._multi_objective import _direction_signs
+from optuna.study._multi_objective import _trials_to_loss_array
 from optuna.trial import TrialState
 from optuna.visualization._plotly_imports import _imports
 
@@ -22,6 +21,8 @@ if _imports.is_successful():
 
 _logger = get_logger(__name__)
 
+_MAX_ARCHIVE_SIZE_FOR_LIST_CHECK = 32
+
 
 class _HypervolumeHistoryInfo(NamedTuple):
     trial_numbers: list[int]
@@ -93,15 +94,21 @@ def _get_hypervolume_history_info(
 
     # Our hypervolume computation module assumes that all objectives are minimized.
     # Here we transform the objective values and the reference point.
-    signs = np.asarray([1 if d == StudyDirection.MINIMIZE else -1 for d in study.directions])
+    signs = _direction_signs(study.directions)
     minimization_reference_point = signs * reference_point
+    # NOTE: The signs are applied to all the trials at once, so that the loop below compares the
+    # loss values directly.
+    loss_values = _trials_to_loss_array(completed_trials, study.directions)
 
     # Only feasible trials are considered in hypervolume computation.
     trial_numbers = []
     values = []
-    best_trials: list[FrozenTrial] = []
+    # NOTE: The loss values of the Pareto optimal trials so far are stacked. While there are a few
+    # of them, a new trial is compared with them one by one in Python, as most of the trials are
+    # rejected by a few comparisons. Otherwise, it is compared with all of them at once.
+    best_loss_values = np.empty((0, len(study.directions)))
     hypervolume = 0.0
-    for trial in completed_trials:
+    for trial, loss_value, loss_list in zip(completed_trials, loss_values, loss_values.tolist()):
         trial_numbers.append(trial.number)
 
         has_constraints = _CONSTRAINTS_KEY in trial.system_attrs
@@ -112,28 +119,33 @@ def _get_hypervolume_history_info(
                 values.append(hypervolume)
                 continue
 
-        if any(map(lambda t: _dominates(t, trial, study.directions), best_trials)):
+        # A trial weakly dominated by a different trial is dominated by it.
+        if len(best_loss_values) <= _MAX_ARCHIVE_SIZE_FOR_LIST_CHECK:
+            is_on_front = not any(
+                best != loss_list and all(b <= v for b, v in zip(best, loss_list))
+                for best in best_loss_values.tolist()
+            )
+        else:
+            is_weakly_dominated = np.all(best_loss_values <= loss_value, axis=1)
+            is_on_front = not np.any(best_loss_values[is_weakly_dominated] != loss_value)
+        if not is_on_front:
             # The trial is not on the Pareto front.
             values.append(hypervolume)
             continue
 
-        best_trials = list(
-            filter(lambda t: not _dominates(trial, t, study.directions), best_trials)
-        ) + [trial]
-
-        loss_vals = np.asarray(
-            list(
-                filter(
-                    lambda v: (v <= minimization_reference_point).all(),
-                    [signs * trial.values for trial in best_trials],
-                )
-            )
+        is_dominated = np.all(loss_value <= best_loss_values, axis=1) & np.any(
+            loss_value < best_loss_values, axis=1
         )
+        best_loss_values = np.vstack([best_loss_values[~is_dominated], loss_value])
+
+        loss_vals = best_loss_values[
+            np.all(best_loss_values <= minimization_reference_point, axis=1)
+        ]
         if loss_vals.size > 0:
             hypervolume = compute_hypervolume(loss_vals, minimization_reference_point)
         values.append(hypervolume)
 
-    if len(best_trials) == 0:
+    if len(best_loss_values) == 0:
         _logger.warning("Your study does not have any feasible trials.")
 
     return _HypervolumeHistoryInfo(trial_numbers, values)
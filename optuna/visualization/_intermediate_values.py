@@ -33,7 +33,7 @@ def _get_intermediate_plot_info(study: Study) -> _IntermediatePlotInfo:
 
     def _satisfies_constraints(trial: FrozenTrial) -> bool:
         constraints = trial.system_attrs.get(_CONSTRAINTS_KEY)
-        return constraints is None or all([x <= 0.0 for x in constraints])
+        return constraints is None or all(x <= 0.0 for x in constraints)
 
     trial_infos = [
         _TrialInfo(
@@ -68,7 +68,7 @@ def _get_optimization_history_info_list(
                 value_states.append(_ValueState.Incomplete)
                 continue
             constraints = trial.system_attrs.get(_CONSTRAINTS_KEY)
-            if constraints is None or all([x <= 0.0 for x in constraints]):
+            if constraints is None or all(x <= 0.0 for x in constraints):
                 value_states.append(_ValueState.Feasible)
             else:
                 value_states.append(_ValueState.Infeasible)
@@ -184,7 +184,7 @@ def _get_rank_subplot_info(
     filtered_ids = []
     for idx, trial in enumerate(trials):
         constraints = trial.system_attrs.get(_CONSTRAINTS_KEY)
-        if constraints is not None and any([x > 0.0 for x in constraints]):
+        if constraints is not None and any(x > 0.0 for x in constraints):
             infeasible_trial_ids.append(idx)
         if x_param in trial.params and y_param in trial.params:
             filtered_ids.append(idx)
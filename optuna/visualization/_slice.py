@@ -82,7 +82,7 @@ def _get_slice_subplot_info(
         plot_info.y.append(target(t))
         plot_info.trial_numbers.append(t.number)
         constraints = t.system_attrs.get(_CONSTRAINTS_KEY)
-        plot_info.constraints.append(constraints is None or all([x <= 0.0 for x in constraints]))
+        plot_info.constraints.append(constraints is None or all(x <= 0.0 for x in constraints))
 
     return plot_info
 
@@ -95,7 +95,7 @@ def _get_timeline_info(study: Study) -> _TimelineInfo:
         infeasible = (
             False
             if _CONSTRAINTS_KEY not in trial.system_attrs
-            else any([x > 0 for x in trial.system_attrs[_CONSTRAINTS_KEY]])
+            else any(x > 0 for x in trial.system_attrs[_CONSTRAINTS_KEY])
         )
         if datetime_complete < datetime_start:
             _logger.warning(
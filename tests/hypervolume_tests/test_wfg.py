@@ -27,6 +27,13 @@ def test_wfg_2d(assume_pareto: bool, n_sols: int) -> None:
     assert optuna._hypervolume.compute_hypervolume(s, r, assume_pareto) == n * n - n * (n - 1) // 2
 
 
+@pytest.mark.parametrize("n_objs", [2, 3])
+@pytest.mark.parametrize("assume_pareto", (True, False))
+def test_wfg_empty(n_objs: int, assume_pareto: bool) -> None:
+    s = np.empty((0, n_objs))
+    assert optuna._hypervolume.compute_hypervolume(s, np.ones(n_objs), assume_pareto) == 0
+
+
 @pytest.mark.parametrize("n_objs", list(range(2, 10)))
 @pytest.mark.parametrize("assume_pareto", (True, False))
 def test_wfg_nd(n_objs: int, assume_pareto: bool) -> None:
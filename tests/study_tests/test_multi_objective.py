@@ -4,9 +4,12 @@ import numpy as np
 import pytest
 
 from optuna.study import StudyDirection
+from optuna.study._multi_objective import _direction_signs
 from optuna.study._multi_objective import _dominates
 from optuna.study._multi_objective import _fast_non_domination_rank
+from optuna.study._multi_objective import _is_pareto_front
 from optuna.study._multi_objective import _normalize_value
+from optuna.study._multi_objective import _trials_to_loss_array
 from optuna.trial import create_trial
 from optuna.trial import TrialState
 
@@ -78,6 +81,34 @@ def test_dominates_2d() -> None:
             assert not _dominates(trial2, trial1, directions)
 
 
+def test_direction_signs() -> None:
+    signs = _direction_signs([StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE])
+    assert np.array_equal(signs, [1.0, -1.0])
+    # The cached array is shared, so it must be read-only.
+    assert not signs.flags.writeable
+
+
+def test_trials_to_loss_array() -> None:
+    directions = [StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE]
+    trials = [create_trial(values=[1, 2]), create_trial(values=[3, 4])]
+    assert np.array_equal(_trials_to_loss_array(trials, directions), [[1, -2], [3, -4]])
+
+
+@pytest.mark.parametrize(
+    "values_list",
+    [
+        [[1, 2], [3]],
+        # The total number of the values matches, but the rows would be misaligned.
+        [[1, 2, 3], [4]],
+    ],
+)
+def test_trials_to_loss_array_invalid(values_list: list[list[float]]) -> None:
+    directions = [StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE]
+    trials = [create_trial(values=values) for values in values_list]
+    with pytest.raises(ValueError):
+        _trials_to_loss_array(trials, directions)
+
+
 def test_dominates_invalid() -> None:
     directions = [StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE]
 
@@ -157,6 +188,14 @@ def test_fast_non_domination_rank(trial_values: list[float], trial_ranks: list[i
     assert np.array_equal(ranks, trial_ranks)
 
 
+def test_fast_non_domination_rank_with_penalty() -> None:
+    loss_values = np.array([[1, 2], [2, 1], [0, 0], [3, 3], [0, 0], [2, 2], [5, 5]], dtype=float)
+    # Feasible: 0, 1, 5. Infeasible: 2, 3, 4 (2 and 4 tie). No penalty information: 6.
+    penalty = np.array([0.0, -1.0, 2.0, 1.0, 2.0, 0.0, np.nan])
+    ranks = _fast_non_domination_rank(loss_values, penalty=penalty)
+    assert np.array_equal(ranks, [0, 0, 3, 2, 3, 1, 4])
+
+
 def test_fast_non_domination_rank_invalid() -> None:
     with pytest.raises(ValueError):
         _fast_non_domination_rank(
@@ -164,6 +203,73 @@ def test_fast_non_domination_rank_invalid() -> None:
         )
 
 
+def _is_pareto_front_naive(loss_values: np.ndarray) -> np.ndarray:
+    is_weakly_dominated = np.all(loss_values[:, np.newaxis] >= loss_values, axis=-1)
+    is_strictly_dominated = np.any(loss_values[:, np.newaxis] > loss_values, axis=-1)
+    return ~np.any(is_weakly_dominated & is_strictly_dominated, axis=1)
+
+
+@pytest.mark.parametrize("n_objectives", [2, 3, 5])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_is_pareto_front(n_objectives: int, seed: int) -> None:
+    rng = np.random.RandomState(seed)
+    # Discrete values produce duplicated solutions and ties in each objective.
+    loss_values = rng.randint(10, size=(500, n_objectives)).astype(float)
+    expected = _is_pareto_front_naive(loss_values)
+    assert np.array_equal(_is_pareto_front(loss_values, assume_unique_lexsorted=False), expected)
+
+
+@pytest.mark.parametrize("n_objectives", [2, 3])
+@pytest.mark.parametrize("assume_unique_lexsorted", [True, False])
+def test_is_pareto_front_empty(n_objectives: int, assume_unique_lexsorted: bool) -> None:
+    on_front = _is_pareto_front(np.empty((0, n_objectives)), assume_unique_lexsorted)
+    assert on_front.shape == (0,)
+
+
+@pytest.mark.parametrize("n_objectives", [3, 4])
+def test_is_pareto_front_large_front(n_objectives: int) -> None:
+    rng = np.random.RandomState(0)
+    # All the solutions on a simplex are Pareto optimal.
+    loss_values = rng.random_sample((500, n_objectives))
+    loss_values /= loss_values.sum(axis=1, keepdims=True)
+    assert np.all(_is_pareto_front(loss_values, assume_unique_lexsorted=False))
+
+
+@pytest.mark.parametrize("n_objectives", [2, 3, 6, 8])
+@pytest.mark.parametrize("n_trials", [50, 200, 600])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_fast_non_domination_rank_against_naive(
+    n_objectives: int, n_trials: int, seed: int
+) -> None:
+    rng = np.random.RandomState(seed)
+    # Small and large n_trials use different algorithms.
+    loss_values = rng.randint(20, size=(n_trials, n_objectives)).astype(float)
+    expected = np.full(len(loss_values), -1)
+    rank = 0
+    while np.any(expected == -1):
+        remaining = np.flatnonzero(expected == -1)
+        expected[remaining[_is_pareto_front_naive(loss_values[remaining])]] = rank
+        rank += 1
+
+    assert np.array_equal(_fast_non_domination_rank(loss_values), expected)
+
+
+@pytest.mark.parametrize("n_objectives", [2, 3, 6])
+@pytest.mark.parametrize("n_trials", [30, 200, 600])
+def test_fast_non_domination_rank_does_not_truncate_front(
+    n_objectives: int, n_trials: int
+) -> None:
+    rng = np.random.RandomState(0)
+    # All the solutions on a simplex are Pareto optimal, and the worse ones form the next front.
+    loss_values = rng.random_sample((n_trials, n_objectives))
+    loss_values /= loss_values.sum(axis=1, keepdims=True)
+    loss_values = np.vstack([loss_values, loss_values + 1.0])
+    # Even if only a few trials are required, the whole front must share the same rank.
+    ranks = _fast_non_domination_rank(loss_values, n_below=3)
+    assert np.all(ranks[:n_trials] == 0)
+    assert np.all(ranks[n_trials:] > 0)
+
+
 def test_normalize_value() -> None:
     assert _normalize_value(1.0, StudyDirection.MINIMIZE) == 1.0
     assert _normalize_value(1.0, StudyDirection.MAXIMIZE) == -1.0
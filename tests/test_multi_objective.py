@@ -81,3 +81,15 @@ def test_get_pareto_front_trials_with_constraint(
             _trial_to_values(t)
             for t in _get_pareto_front_trials_by_trials(trials, study_dirs, consider_constraint)
         }
+
+
+def test_get_pareto_front_trials_keeps_order() -> None:
+    # The Pareto optimal trials are neither sorted by their values nor contiguous.
+    values_list = [[2, 0], [1, 1], [3, 3], [0, 2], [1, 1], [2, 2], [2, 0]]
+    trials = [trial.create_trial(values=values) for values in values_list]
+    for number, t in enumerate(trials):
+        t.number = number
+
+    directions = [StudyDirection.MINIMIZE, StudyDirection.MINIMIZE]
+    best_trials = _get_pareto_front_trials_by_trials(trials, directions)
+    assert [t.number for t in best_trials] == [0, 1, 3, 4, 6]
@@ -5,6 +5,7 @@ import pytest
 
 from optuna.samplers import NSGAIISampler
 from optuna.study import create_study
+from optuna.trial import create_trial
 from optuna.trial import FrozenTrial
 from optuna.trial import Trial
 from optuna.visualization._hypervolume_history import _get_hypervolume_history_info
@@ -55,3 +56,37 @@ def test_get_optimization_history_info(directions: str) -> None:
     assert info == _HypervolumeHistoryInfo(
         trial_numbers=[0, 1, 2, 3, 4, 5], values=[0.0, 0.0625, 0.0625, 0.25, 0.3125, 1.0]
     )
+
+
+def _compute_2d_hypervolume_naive(loss_values: np.ndarray, reference_point: np.ndarray) -> float:
+    # Sum up the area newly dominated by each solution sorted by the first objective.
+    hypervolume = 0.0
+    min_value1 = reference_point[1]
+    for value0, value1 in sorted(loss_values.tolist()):
+        if value0 < reference_point[0] and value1 < min_value1:
+            hypervolume += (reference_point[0] - value0) * (min_value1 - value1)
+            min_value1 = value1
+    return hypervolume
+
+
+def test_get_hypervolume_history_info_large_front() -> None:
+    rng = np.random.RandomState(0)
+    # All the solutions on a simplex are Pareto optimal, so that the front gets large.
+    on_simplex = rng.random_sample(100)
+    loss_values = np.stack([on_simplex, 1.0 - on_simplex], axis=-1)
+    # Add duplicated solutions, dominated solutions, and solutions dominating the previous ones.
+    loss_values = np.vstack(
+        [loss_values, loss_values[:20], loss_values[:20] + 0.1, loss_values[:20] * 0.9]
+    )
+    rng.shuffle(loss_values)
+    study = create_study(directions=["minimize", "maximize"])
+    study.add_trials([create_trial(values=[v0, -v1]) for v0, v1 in loss_values.tolist()])
+
+    reference_point = np.asarray([1.05, -1.05])
+    info = _get_hypervolume_history_info(study, reference_point)
+    expected = [
+        _compute_2d_hypervolume_naive(loss_values[: i + 1], np.asarray([1.05, 1.05]))
+        for i in range(len(loss_values))
+    ]
+    assert info.trial_numbers == list(range(len(loss_values)))
+    assert np.allclose(info.values, expected)